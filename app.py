@@ -1,8 +1,13 @@
+import backends
+import regression
+import startup
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import os
+import time
+from survey import grade_bands, mode_cols, rename_map, tool_cols
+
+run_started = time.perf_counter()
 
 # Set page config
 st.set_page_config(page_title="AI Usage & Academic Outcomes Dashboard", layout="wide")
@@ -11,15 +16,12 @@ st.set_page_config(page_title="AI Usage & Academic Outcomes Dashboard", layout="
 st.title("Data Analysis Dashboard: Navigating Learning with AI: Usage Patterns and Academic Outcomes of IT Students of NEUST Talavera Off-Campus")
 st.markdown("Analyze correlation trends, mean values, and custom relationships.")
 
-# --- HELPER: Categorize Grades ---
+# --- HELPER: Categorize Grades (bands in survey.py) ---
 def categorize_grade(grade):
     if pd.isna(grade): return "Unknown"
-    elif grade <= 1.25: return "Excellent"
-    elif grade <= 1.75: return "Very Good"
-    elif grade <= 2.25: return "Good"
-    elif grade <= 2.75: return "Average"
-    elif grade <= 3.00: return "Satistfactory"
-    else: return "Fail"
+    for upper, label in grade_bands:
+        if grade <= upper: return label
+    return "Fail"
 
 # --- HELPER: Likert Mapping ---
 likert_mapping = {
@@ -34,21 +36,36 @@ likert_order = ["Strongly Disagree", "Disagree", "Neutral", "Agree", "Strongly A
 grade_order = ["Excellent", "Very Good", "Good", "Average", "Satistfactory", "Fail", "Unknown"]
 
 # --- DATA LOADER ---
-@st.cache_data
 def load_data():
-    possible_filenames = ["dataset.csv", "dataset.xlsx"]
-    for filename in possible_filenames:
+    for filename in startup.DATASET_FILENAMES:
         if os.path.exists(filename):
             try:
-                if filename.endswith(".csv"):
-                    return pd.read_csv(filename)
-                elif filename.endswith(".xlsx"):
-                    return pd.read_excel(filename)
+                return startup.load_dataset_file(filename)
             except Exception as e:
                 st.error(f"Found {filename} but couldn't read it: {e}")
     return None
 
-df = load_data()
+# --- REGRESSION: CROSS-PRODUCTS (built once per dataset + target) ---
+@st.cache_data
+def load_cross_products(_backend, backend_key, dataset_key, target, columns):
+    return _backend.cross_products(target, list(columns))
+
+# --- BACKEND QUERIES (cached per dataset + arguments, so reruns don't rescan the data) ---
+def query(method, *args):
+    return backends.cached_query(backend, backend.key, dataset_key, method, args)
+
+# DuckDB mode: every statistic runs over all Parquet rows; only a preview is held in memory
+if backends.selected_backend() == "duckdb":
+    try:
+        backend = backends.get_backend(None, grade_bands, tool_cols + mode_cols, rename_map)
+    except Exception as e:
+        st.error(f"Couldn't open the Parquet data for the DuckDB backend: {e}")
+        st.stop()
+    dataset_key = backend.key
+    df = query("preview", backends.PREVIEW_ROWS)
+else:
+    df = load_data()
+    dataset_key = "local"
 
 # File Uploader Backup
 if df is None:
@@ -60,6 +77,7 @@ if df is None:
                 df = pd.read_csv(uploaded_file)
             elif uploaded_file.name.endswith(".xlsx"):
                 df = pd.read_excel(uploaded_file)
+            dataset_key = f"upload:{uploaded_file.file_id}"
         except Exception as e:
             st.error(f"Error reading uploaded file: {e}")
 
@@ -68,68 +86,7 @@ if df is not None:
     # 0. Safety: Remove Duplicate Columns
     df = df.loc[:, ~df.columns.duplicated()]
 
-    # --- RENAME COLUMNS (ALL SECTIONS) ---
-    rename_map = {
-        # --- GPI SECTION ---
-        "I believe AI has great potential to improve the\nquality of higher education for students.": "GPI Question #1",
-        "I believe AI has great potential to improve the quality of higher education for students.": "GPI Question #1",
-        "I think AI can positively transform the way students\nlearn and study.": "GPI Question #2",
-        "I think AI can positively transform the way students learn and study.": "GPI Question #2",
-        "AI can personalize my learning experiences\naccording to my needs.": "GPI Question #3",
-        "AI can personalize my learning experiences according to my needs.": "GPI Question #3",
-        "I am aware of AI applications being implemented\nin my educational institution.": "GPI Question #4",
-        "I am aware of AI applications being implemented in my educational institution.": "GPI Question #4",
-        "I have experienced benefits in my learning due to\nthe use of AI tools.": "GPI Question #5",
-        "I have experienced benefits in my learning due to the use of AI tools.": "GPI Question #5",
-
-        # --- UAI SECTION ---
-        "I use AI systems (e.g., learning platforms, chatbots) to support\nmy studies.": "UAI Question #1",
-        "I use AI systems (e.g., learning platforms, chatbots) to support my studies.": "UAI Question #1",
-        "I have used online learning platforms that apply AI to assess\nmy progress and adapt content.": "UAI Question #2",
-        "I have used online learning platforms that apply AI to assess my progress and adapt content.": "UAI Question #2",
-        "I interact with AI chatbots or virtual assistants to get academic\nhelp.": "UAI Question #3",
-        "I interact with AI chatbots or virtual assistants to get academic help.": "UAI Question #3",
-        "I use AI tools in research, data analysis, or coding tasks for my\ncourses.": "UAI Question #4",
-        "I use AI tools in research, data analysis, or coding tasks for my courses.": "UAI Question #4",
-        "In my experience, AI has had a positive impact on my learning\nand academic performance.": "UAI Question #5",
-        "In my experience, AI has had a positive impact on my learning and academic performance.": "UAI Question #5",
-
-        # --- ISE SECTION ---
-        "AI helps personalize learning content according to my needs\nand preferences.": "ISE Question #1",
-        "AI helps personalize learning content according to my needs and preferences.": "ISE Question #1",
-        "AI makes learning resources more accessible for me and my\npeers.": "ISE Question #2",
-        "AI makes learning resources more accessible for me and my peers.": "ISE Question #2",
-        "AI improves my ability to keep up with online or hybrid\nclasses.": "ISE Question #3",
-        "AI improves my ability to keep up with online or hybrid classes.": "ISE Question #3",
-        "AI influences how academic tasks and assignments are\nmanaged in my courses.": "ISE Question #4",
-        "AI influences how academic tasks and assignments are managed in my courses.": "ISE Question #4",
-        "AI enhances interaction and communication with my\nclassmates and instructors.": "ISE Question #5",
-        "AI enhances interaction and communication with my classmates and instructors.": "ISE Question #5",
-
-        # --- CAU SECTION ---
-        "I am concerned about the privacy of my personal data when AI\nsystems are used.": "CAU Question #1",
-        "I am concerned about the privacy of my personal data when AI systems are used.": "CAU Question #1",
-        "I am concerned that AI could create inequality in access to\neducational resources.": "CAU Question #2",
-        "I am concerned that AI could create inequality in access to educational resources.": "CAU Question #2",
-        "I worry that AI could replace some teaching or learning roles in the\nfuture.": "CAU Question #3",
-        "I worry that AI could replace some teaching or learning roles in the future.": "CAU Question #3",
-        "I am concerned about ethical issues in the use of AI algorithms in\neducation.": "CAU Question #4",
-        "I am concerned about ethical issues in the use of AI algorithms in education.": "CAU Question #4",
-        "I feel well-informed about institutional policies and practices\nregarding AI usage.": "CAU Question #5",
-        "I feel well-informed about institutional policies and practices regarding AI usage.": "CAU Question #5",
-
-        # --- EAI SECTION ---
-        "I believe AI will play a more significant role in higher\neducation in the future.": "EAI Question #1",
-        "I believe AI will play a more significant role in higher education in the future.": "EAI Question #1",
-        "I hope that AI will enhance the quality of learning in the\ncoming years.": "EAI Question #2",
-        "I hope that AI will enhance the quality of learning in the coming years.": "EAI Question #2",
-        "I expect AI to make higher education more accessible for\nstudents.": "EAI Question #3",
-        "I expect AI to make higher education more accessible for students.": "EAI Question #3",
-        "I believe AI will be essential in online learning and education\nin the future.": "EAI Question #4",
-        "I believe AI will be essential in online learning and education in the future.": "EAI Question #4",
-        "I think specific areas of my courses or field of study will\nbenefit from AI development.": "EAI Question #5",
-        "I think specific areas of my courses or field of study will benefit from AI development.": "EAI Question #5"
-    }
+    # --- RENAME COLUMNS (ALL SECTIONS, map in survey.py) ---
     df.rename(columns=rename_map, inplace=True)
 
     # 1. Clean Grade Column
@@ -143,13 +100,11 @@ if df is not None:
         df['Grade Category'] = df[grade_col_name].apply(categorize_grade)
 
     # 2. Clean Tool Columns
-    tool_cols = ['AI CHATBOT', 'AI FOR PROGRAMMING', 'WRITING ASSISTANT']
     for col in tool_cols:
         if col in df.columns:
             df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
             
     # 3. Clean Purpose Columns
-    mode_cols = ['Coding', 'Academic Assignment', 'Learning Support', 'Research']
     for col in mode_cols:
         if col in df.columns:
             df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
@@ -157,15 +112,19 @@ if df is not None:
     # 4. Create Respondent ID Column if not exists
     if 'Respondent ID' not in df.columns:
         df.insert(0, 'Respondent ID', range(1, len(df) + 1))
+
+    # 5. Query Backend (pandas by default, DuckDB over Parquet when configured)
+    backend = backends.get_backend(df, grade_bands, tool_cols + mode_cols, rename_map)
     
     # --- SIDEBAR SETTINGS ---
     st.sidebar.header("Settings")
     
     # --- SHOW DATASET TOGGLE ---
     show_raw_data = st.sidebar.checkbox("Show Raw Dataset", value=False)
+    show_startup_profile = st.sidebar.checkbox("Show Startup Profile", value=False)
 
-    numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns.tolist()
-    all_cols = df.columns.tolist()
+    numeric_cols = backend.numeric_columns()
+    all_cols = backend.columns()
     
     # A. Target Variable (Global)
     default_target_ix = 0
@@ -193,32 +152,33 @@ if df is not None:
     # --- DISPLAY RAW DATA IF CHECKED ---
     if show_raw_data:
         st.subheader("Raw Dataset Preview")
-        st.markdown(f"**Shape:** {df.shape[0]} rows × {df.shape[1]} columns")
+        total_rows = query("row_count")
+        st.markdown(f"**Shape:** {total_rows} rows × {df.shape[1]} columns")
+        if total_rows > len(df):
+            st.caption(f"ℹ️ Showing the first {len(df)} rows. Statistics and aggregations use all rows; Raw Data plots use these rows.")
         st.dataframe(df, use_container_width=True)
         st.divider()
 
     # --- CALCULATION LOGIC (Global) ---
     if target_var and compared_attributes:
-        # Pre-process for Sidebar logic
+        # Pre-process for Sidebar logic. Every mode reads the coerced data; the regression
+        # keeps the dataset backend, so its cached cross-products don't depend on this selection
+        df = df.copy()
         df[target_var] = pd.to_numeric(df[target_var], errors='coerce')
         for col in compared_attributes:
             df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+        dataset_backend = backend
+        backend = backend.with_selection(df, target_var, compared_attributes)
 
         # Correlation Calculation
-        global_corrs = df[compared_attributes].corrwith(df[target_var])
+        global_corrs = query("corr_with", compared_attributes, target_var)
         is_grade_target = (target_var == grade_col_name)
         if is_grade_target:
             global_corrs = global_corrs * -1
         global_corr_df = pd.DataFrame({'Attribute': global_corrs.index, 'Correlation': global_corrs.values})
         
         # --- COMPREHENSIVE STATISTICS CALCULATION ---
-        stats_df = df[compared_attributes].agg(['mean', 'median', 'std', 'var', 'min', 'max', 'skew', 'kurt'])
-        modes = df[compared_attributes].mode().iloc[0]
-        stats_df.loc['mode'] = modes
-        
-        summary_df = stats_df.T
-        summary_df.columns = ['Mean', 'Median', 'Std Dev', 'Variance', 'Min', 'Max', 'Skewness', 'Kurtosis', 'Mode']
-        summary_df = summary_df[['Mean', 'Median', 'Mode', 'Std Dev', 'Variance', 'Min', 'Max', 'Skewness', 'Kurtosis']]
+        summary_df = query("describe", compared_attributes)
 
         # --- SECTION 1: COMPUTED STATISTICS ---
         st.header("1. Computed Statistics")
@@ -262,9 +222,12 @@ if df is not None:
         # --- DATA MODE SELECTOR ---
         data_mode = st.radio(
             "Data Representation Mode:", 
-            ["Raw Data (Individual)", "Count (Frequency)", "Likert Scale Distribution", "Mean Value (Flexible)", "Trend of Correlation Coefficient"], 
+            ["Raw Data (Individual)", "Count (Frequency)", "Likert Scale Distribution", "Mean Value (Flexible)", "Trend of Correlation Coefficient", "Multiple Regression (OLS)"], 
             horizontal=True
         )
+        # Modes that plot one coefficient per attribute
+        is_coef_mode = data_mode in ["Trend of Correlation Coefficient", "Multiple Regression (OLS)"]
+        coef_cols = ["Attribute", "Correlation"] if data_mode == "Trend of Correlation Coefficient" else ["Attribute", "Std. Coefficient", "Coefficient", "VIF"]
 
         # --- NEW GLOBAL SORTING ORDER ---
         sort_order = st.radio(
@@ -306,9 +269,7 @@ if df is not None:
                     )
                 
             if corr_target_var and corr_attr_vars:
-                target_series = pd.to_numeric(df[corr_target_var], errors='coerce')
-                attr_df = df[corr_attr_vars].apply(pd.to_numeric, errors='coerce').fillna(0)
-                local_corr = attr_df.corrwith(target_series)
+                local_corr = query("corr_with", corr_attr_vars, corr_target_var)
                 
                 if "Grade" in corr_target_var:
                     local_corr = local_corr * -1
@@ -330,15 +291,17 @@ if df is not None:
                 likert_color_var = st.selectbox("Color Stack By:", ["Response", "Grade Category", "Question"], index=0)
 
             # 2. Select Questions
-            possible_likert = [c for c in numeric_cols if df[c].nunique() < 15]
-            if not possible_likert: possible_likert = numeric_cols[:5]
+            likert_options = [c for c in all_cols if c not in ["Respondent ID", target_var]]
+            likert_numeric = [c for c in numeric_cols if c in likert_options]
+            possible_likert = [c for c in likert_numeric if df[c].nunique() < 15]
+            if not possible_likert: possible_likert = likert_numeric[:5]
             
             likert_cols = []
             if likert_xaxis_var == "Grade Category":
                 st.caption("ℹ️ **Optional:** Select questions to break down responses by grade. Leave empty to see Grade Counts only.")
-                likert_cols = st.multiselect("Select Likert Questions (Optional):", options=[c for c in all_cols if c not in ["Respondent ID", target_var]], default=[])
+                likert_cols = st.multiselect("Select Likert Questions (Optional):", options=likert_options, default=[])
             else:
-                likert_cols = st.multiselect("Select Likert Questions:", options=[c for c in all_cols if c not in ["Respondent ID", target_var]], default=possible_likert[:5])
+                likert_cols = st.multiselect("Select Likert Questions:", options=likert_options, default=possible_likert[:5])
             
             # 3. Categorization Logic
             st.markdown("---")
@@ -363,7 +326,7 @@ if df is not None:
                 if likert_color_mode == "By Legend (Categories)":
                     qual_opts = ["Plotly", "D3", "G10", "T10", "Alphabet", "Dark24", "Light24", "Pastel", "Bold"]
                     sel_qual = st.selectbox("Theme:", qual_opts, index=0)
-                    discrete_seq = getattr(px.colors.qualitative, sel_qual)
+                    discrete_seq = getattr(startup.lazy_import("plotly.colors").qualitative, sel_qual)
                 elif likert_color_mode == "By Count (Scale)":
                     scale_opts = ["Viridis", "Plasma", "Inferno", "Magma", "Cividis", "Blues", "Reds", "Greens"]
                     selected_scale = st.selectbox("Palette:", scale_opts, index=5)
@@ -372,13 +335,8 @@ if df is not None:
 
             # --- PROCESSING LOGIC ---
             if likert_cols:
-                subset = df[likert_cols].copy()
-                if 'Grade Category' in df.columns:
-                    subset['Grade Category'] = df['Grade Category']
-                else:
-                    subset['Grade Category'] = "Unknown"
-
-                melted = subset.melt(id_vars=['Grade Category'], var_name="Question", value_name="Response")
+                # Raw response counts come from the backend; labels are mapped on the small result
+                melted = query("likert_counts", likert_cols, 'Grade Category')
                 
                 # MAPPING LOGIC
                 if likert_label_mode == "Likert 5-Point (Strongly Disagree...)":
@@ -403,7 +361,7 @@ if df is not None:
                 grp_cols = [likert_xaxis_var, likert_color_var]
                 grp_cols = list(dict.fromkeys(grp_cols)) # Dedup
                 
-                plot_df = melted.groupby(grp_cols, observed=True).size().reset_index(name="Count")
+                plot_df = melted.groupby(grp_cols, observed=True)["Count"].sum().reset_index()
                 plot_df = plot_df[plot_df["Count"] > 0] 
                 
                 if likert_val_type == "Percentage":
@@ -415,8 +373,7 @@ if df is not None:
 
             elif likert_xaxis_var == "Grade Category" and not likert_cols:
                 if 'Grade Category' in df.columns:
-                    plot_df = df['Grade Category'].value_counts().reset_index()
-                    plot_df.columns = ['Grade Category', 'Count']
+                    plot_df = query("value_counts", 'Grade Category')
                     plot_df['Grade Category'] = pd.Categorical(plot_df['Grade Category'], categories=grade_order, ordered=True)
                     
                     if likert_val_type == "Percentage":
@@ -445,24 +402,49 @@ if df is not None:
             if metric_cols:
                 try:
                     if group_cols:
-                        count_df = df.groupby(group_cols).size().reset_index(name="Count")
-                        mean_df = df.groupby(group_cols)[metric_cols].mean().add_prefix("Mean ").reset_index()
-                        median_df = df.groupby(group_cols)[metric_cols].median().add_prefix("Median ").reset_index()
-                        agg_df = pd.merge(count_df, mean_df, on=group_cols)
-                        agg_df = pd.merge(agg_df, median_df, on=group_cols)
+                        agg_df = query("group_mean_median", group_cols, metric_cols)
                     else:
-                        means = df[metric_cols].mean()
-                        medians = df[metric_cols].median()
-                        agg_df = pd.DataFrame({
-                            "Metric Name": metric_cols,
-                            "Mean Value": means.values,
-                            "Median Value": medians.values
-                        })
+                        agg_df = query("mean_median", metric_cols)
                 except Exception as e:
                     st.error(f"Aggregation Error: {e}")
             plot_df = agg_df
 
-        # D. SETUP FOR OTHERS
+        # D. SETUP FOR REGRESSION
+        elif data_mode == "Multiple Regression (OLS)":
+            with st.expander("Step 1: Regression Settings (Input Data)", expanded=True):
+                c_reg1, c_reg2 = st.columns(2)
+                with c_reg1:
+                    reg_target_var = st.selectbox(
+                        "Select Target Variable:",
+                        options=numeric_cols,
+                        index=numeric_cols.index(grade_col_name) if grade_col_name in numeric_cols else 0
+                    )
+                reg_candidates = [c for c in numeric_cols if c not in ["Respondent ID", reg_target_var]]
+                with c_reg2:
+                    reg_attr_vars = st.multiselect(
+                        "Select Predictors:",
+                        options=reg_candidates,
+                        default=[c for c in compared_attributes if c in reg_candidates]
+                    )
+
+            if reg_target_var and reg_attr_vars:
+                # X'X and X'y for every candidate are cached; changing predictors only re-solves
+                gram = load_cross_products(dataset_backend, dataset_backend.key, dataset_key, reg_target_var, tuple(reg_candidates))
+                try:
+                    coef_df, fit = regression.fit_ols(gram, reg_target_var, reg_attr_vars)
+                    m1, m2, m3, m4 = st.columns(4)
+                    m1.metric("R²", f"{fit['R²']:.4f}")
+                    m2.metric("Adjusted R²", f"{fit['Adjusted R²']:.4f}")
+                    m3.metric("Intercept", f"{fit['Intercept']:.4f}")
+                    m4.metric("Observations", fit["Observations"])
+                    if "Grade" in reg_target_var:
+                        st.caption("ℹ️ Note: Coefficients are not flipped; a negative value means a lower (better) Grade.")
+                    st.dataframe(coef_df.set_index("Attribute"), use_container_width=True)
+                    plot_df = coef_df
+                except ValueError as e:
+                    st.warning(f"⚠️ Regression Error: {e}")
+
+        # E. SETUP FOR OTHERS
         else:
             plot_df = df.copy()
 
@@ -481,9 +463,9 @@ if df is not None:
         with c1:
             if data_mode == "Likert Scale Distribution":
                 x_axis = likert_xaxis_var
-            elif data_mode == "Trend of Correlation Coefficient":
+            elif is_coef_mode:
                 st.markdown("**X-Axis:**")
-                x_cols = st.selectbox("Select X Dimension:", options=["Attribute", "Correlation"], index=0) 
+                x_cols = st.selectbox("Select X Dimension:", options=coef_cols, index=0) 
                 x_axis = x_cols
             elif data_mode == "Count (Frequency)":
                 x_cols = st.multiselect("Category to Count (X-axis):", options=all_cols, default=[all_cols[0]] if all_cols else None)
@@ -504,9 +486,9 @@ if df is not None:
                     y_axis = "Percentage"
                 else:
                     y_axis = "Count"
-            elif data_mode == "Trend of Correlation Coefficient":
+            elif is_coef_mode:
                 st.markdown("**Y-Axis:**")
-                y_cols = st.selectbox("Select Y Dimension:", options=["Attribute", "Correlation"], index=1)
+                y_cols = st.selectbox("Select Y Dimension:", options=coef_cols, index=1)
                 y_axis = y_cols
             elif data_mode == "Count (Frequency)":
                 st.info("Y-axis: Count (Auto)")
@@ -533,8 +515,8 @@ if df is not None:
                     color_enc = "Grade Category"
                 else:
                     color_enc = likert_color_var
-            elif data_mode == "Trend of Correlation Coefficient":
-                color_enc = st.selectbox("Color By:", options=[None, "Attribute", "Correlation"], index=2)
+            elif is_coef_mode:
+                color_enc = st.selectbox("Color By:", options=[None] + coef_cols, index=2)
             elif data_mode == "Mean Value (Flexible)":
                 if not agg_df.empty:
                     color_enc = st.selectbox("Color By:", options=[None] + agg_df.columns.tolist(), index=0)
@@ -548,14 +530,17 @@ if df is not None:
             if data_mode != "Likert Scale Distribution":
                 use_scale = False
                 
-                if data_mode == "Trend of Correlation Coefficient" and color_enc == "Correlation":
+                if is_coef_mode and color_enc and color_enc != "Attribute":
                     use_scale = True
                 elif data_mode == "Mean Value (Flexible)" and color_enc and not agg_df.empty:
                     if pd.api.types.is_numeric_dtype(agg_df[color_enc]):
                         use_scale = True
-                elif color_enc and data_mode not in ["Likert Scale Distribution", "Mean Value (Flexible)", "Trend of Correlation Coefficient"]:
+                elif color_enc and data_mode not in ["Likert Scale Distribution", "Mean Value (Flexible)"] and not is_coef_mode:
                     if color_enc in df.columns and pd.api.types.is_numeric_dtype(df[color_enc]) and len(df[color_enc].unique()) > 10:
                         use_scale = True
+                # px.line / px.area have no continuous color scale; numeric colors fall back to a legend
+                if graph_type in ["Line Graph", "Area Chart"]:
+                    use_scale = False
                 
                 if use_scale:
                     scale_opts = ["Viridis", "Plasma", "Inferno", "Magma", "Cividis", "Blues", "Reds", "Greens"]
@@ -563,7 +548,7 @@ if df is not None:
                 elif color_enc:
                     qual_opts = ["Plotly", "D3", "G10", "T10", "Alphabet", "Dark24", "Light24", "Pastel", "Bold"]
                     sel_qual = st.selectbox("Legend Theme:", qual_opts, index=0)
-                    discrete_seq = getattr(px.colors.qualitative, sel_qual)
+                    discrete_seq = getattr(startup.lazy_import("plotly.colors").qualitative, sel_qual)
                 else:
                     custom_color = st.color_picker("Pick Color:", "#1f77b4")
 
@@ -577,7 +562,7 @@ if df is not None:
                 if not x_cols: raise ValueError("Select X-axis.")
                 groups = x_cols.copy()
                 if color_enc and color_enc not in groups: groups.append(color_enc)
-                plot_df = df.groupby(groups).size().reset_index(name='Count')
+                plot_df = query("group_count", groups)
                 x_axis = x_cols
 
             # Raw Logic
@@ -585,7 +570,7 @@ if df is not None:
                 if len(y_cols) == 1 and y_cols[0] == "Count":
                     groups = x_cols.copy() if isinstance(x_cols, list) else [x_cols]
                     if color_enc and color_enc not in groups: groups.append(color_enc)
-                    plot_df = df.groupby(groups).size().reset_index(name='Count')
+                    plot_df = query("group_count", groups)
                     y_axis = "Count"
                 else:
                     y_axis = y_cols
@@ -594,6 +579,8 @@ if df is not None:
             # Correlation / Aggregate / Likert already have plot_df ready
             elif data_mode == "Trend of Correlation Coefficient":
                 if plot_df.empty: raise ValueError("Please select a Target and Attributes in Step 1.")
+            elif data_mode == "Multiple Regression (OLS)":
+                if plot_df.empty: raise ValueError("Please select a Target and Predictors in Step 1.")
             elif data_mode == "Mean Value (Flexible)":
                 x_axis = x_cols
                 y_axis = y_cols
@@ -614,6 +601,9 @@ if df is not None:
                     
                     if data_mode == "Trend of Correlation Coefficient":
                         plot_df = plot_df.sort_values(by="Correlation", ascending=is_asc)
+
+                    elif data_mode == "Multiple Regression (OLS)":
+                        plot_df = plot_df.sort_values(by="Std. Coefficient", ascending=is_asc)
                         
                     elif data_mode == "Count (Frequency)":
                         plot_df = plot_df.sort_values(by="Count", ascending=is_asc)
@@ -661,6 +651,10 @@ if df is not None:
                 if data_mode == "Trend of Correlation Coefficient":
                     plot_df['Label'] = plot_df['Correlation'].apply(lambda x: f"{x:.4f}")
                     plot_args["text"] = 'Label'
+                elif data_mode == "Multiple Regression (OLS)":
+                    label_col = final_y if final_y != "Attribute" else final_x
+                    plot_df['Label'] = plot_df[label_col].apply(lambda x: f"{x:.4f}" if label_col != "Attribute" else x)
+                    plot_args["text"] = 'Label'
                 elif final_y and graph_type in ["Scatter Plot", "Line Graph", "Area Chart"] and not isinstance(final_y, list):
                     plot_args["text"] = final_y
 
@@ -680,27 +674,28 @@ if df is not None:
                 else: plot_args["color_discrete_sequence"] = [custom_color]
 
                 fig = None
+                px = startup.lazy_import("plotly.express")
                 
                 # Standard Plot Types
                 if graph_type == "Scatter Plot":
                     fig = px.scatter(**plot_args)
-                    if data_mode != "Trend of Correlation Coefficient": fig.update_traces(textposition='top center')
+                    if not is_coef_mode: fig.update_traces(textposition='top center')
                 elif graph_type == "Line Graph":
                     fig = px.line(**plot_args)
-                    if data_mode == "Trend of Correlation Coefficient":
+                    if is_coef_mode:
                         fig.update_traces(textposition='top center', mode='lines+markers+text')
                     elif not isinstance(final_y, list): 
                         fig.update_traces(textposition='top center')
                 elif graph_type == "Area Chart":
                     fig = px.area(**plot_args)
-                    if data_mode == "Trend of Correlation Coefficient":
+                    if is_coef_mode:
                         fig.update_traces(textposition='top center', mode='lines+markers+text')
                 elif graph_type == "Bar Graph (Vertical)":
-                    fig = px.bar(**plot_args, text_auto=(data_mode != "Trend of Correlation Coefficient"))
-                    if data_mode == "Trend of Correlation Coefficient": fig.update_traces(textposition='auto')
+                    fig = px.bar(**plot_args, text_auto=(not is_coef_mode))
+                    if is_coef_mode: fig.update_traces(textposition='auto')
                 elif graph_type == "Bar Graph (Horizontal)":
-                    fig = px.bar(**plot_args, orientation='h', text_auto=(data_mode != "Trend of Correlation Coefficient"))
-                    if data_mode == "Trend of Correlation Coefficient": fig.update_traces(textposition='auto')
+                    fig = px.bar(**plot_args, orientation='h', text_auto=(not is_coef_mode))
+                    if is_coef_mode: fig.update_traces(textposition='auto')
                 
                 # Complex Types
                 elif graph_type == "Stacked Bar Graph (Custom)": fig = px.bar(**plot_args, barmode='stack', text_auto=True)
@@ -719,9 +714,9 @@ if df is not None:
                 elif graph_type == "Density Heatmap": fig = px.density_heatmap(**plot_args, text_auto=True)
                 
                 # CORRELATION ZERO LINE
-                if data_mode == "Trend of Correlation Coefficient" and fig:
-                    is_y_corr = (final_y == "Correlation")
-                    is_x_corr = (final_x == "Correlation")
+                if is_coef_mode and fig:
+                    is_y_corr = (final_y in ["Correlation", "Coefficient", "Std. Coefficient"])
+                    is_x_corr = (final_x in ["Correlation", "Coefficient", "Std. Coefficient"])
                     
                     if is_y_corr:
                         fig.add_hline(y=0, line_dash="dash", line_color="black")
@@ -738,3 +733,9 @@ if df is not None:
 
     else:
         st.info("Please select a Target and Attributes in the sidebar.")
+
+    # --- STARTUP PROFILE ---
+    startup.mark_render(run_started)
+    if show_startup_profile:
+        st.sidebar.subheader("Startup Profile")
+        st.sidebar.dataframe(startup.profile_report().set_index("Step"), use_container_width=True)
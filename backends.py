@@ -0,0 +1,379 @@
+"""
+Query backends for the dashboard's aggregations.
+
+The plotting code only ever needs small result frames (column schema, descriptive
+statistics, correlations, group counts, means/medians, Likert tabulations, value counts,
+regression cross-products). A backend computes those:
+
+- PandasBackend (default): runs on the in-memory DataFrame.
+- DuckDBBackend: pushes everything down to DuckDB over Parquet files, so pooled
+  multi-year data does not have to fit in RAM. app.py's cleaning (short names for the
+  question headers, numeric grade, 'Grade Category', zero-filled tool/purpose columns,
+  'Respondent ID') is applied in a DuckDB view, and the app only keeps a preview of rows
+  in memory for row-level plots.
+
+DuckDB is optional (pip install duckdb) and only imported when selected. Select with
+environment variables:
+
+    DASHBOARD_QUERY_BACKEND=duckdb DASHBOARD_PARQUET="data/*.parquet" streamlit run app.py
+"""
+import copy
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import startup
+
+INTERCEPT = "(Intercept)"
+GRADE_COLUMN = "Current Year Average Grade:"
+NUMERIC_SQL_TYPES = ("TINYINT", "SMALLINT", "INTEGER", "BIGINT", "HUGEINT", "UTINYINT", "USMALLINT",
+                     "UINTEGER", "UBIGINT", "FLOAT", "DOUBLE", "DECIMAL")
+SUMMARY_COLUMNS = ['Mean', 'Median', 'Mode', 'Std Dev', 'Variance', 'Min', 'Max', 'Skewness', 'Kurtosis']
+PREVIEW_ROWS = 10000  # DuckDB mode: rows held in memory for row-level plots
+
+_duckdb_backends = {}
+
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _literal(value):
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def find_grade_column(columns):
+    """The grade column app.py cleans: the survey's own name, else the first column mentioning 'Grade'."""
+    if GRADE_COLUMN in columns:
+        return GRADE_COLUMN
+    possible = [c for c in columns if "Grade" in c and c != "Grade Category"]
+    return possible[0] if possible else None
+
+
+def _selection_key(key, target, attributes):
+    return f"{key}|{target!r}|{list(attributes)!r}"
+
+
+def _restore_numeric(series):
+    """Undo the VARCHAR cast used to UNPIVOT mixed-type columns when every value is numeric."""
+    numeric = pd.to_numeric(series, errors="coerce")
+    return numeric if numeric.notna().sum() == series.notna().sum() else series
+
+
+class PandasBackend:
+    """Aggregations over an in-memory DataFrame (the default)."""
+
+    name = "pandas"
+
+    def __init__(self, df, key="pandas"):
+        self.df = df
+        self.key = key
+
+    def with_selection(self, df, target, attributes):
+        """Backend over app.py's frame after the sidebar coercion (numeric target, zero-filled attributes)."""
+        return PandasBackend(df, _selection_key(self.key, target, attributes))
+
+    def columns(self):
+        return self.df.columns.tolist()
+
+    def numeric_columns(self):
+        return self.df.select_dtypes(include=['float64', 'int64']).columns.tolist()
+
+    def row_count(self):
+        return len(self.df)
+
+    def _attributes(self, cols):
+        # Same coercion as the sidebar: non-numeric values and blanks count as 0
+        return self.df[cols].apply(pd.to_numeric, errors="coerce").fillna(0)
+
+    def describe(self, cols):
+        """Descriptive statistics per attribute (rows = attributes, columns = SUMMARY_COLUMNS)."""
+        data = self._attributes(cols)
+        stats_df = data.agg(['mean', 'median', 'std', 'var', 'min', 'max', 'skew', 'kurt'])
+        stats_df.loc['mode'] = data.mode().iloc[0]
+        summary_df = stats_df.T
+        summary_df.columns = ['Mean', 'Median', 'Std Dev', 'Variance', 'Min', 'Max', 'Skewness', 'Kurtosis', 'Mode']
+        return summary_df[SUMMARY_COLUMNS]
+
+    def corr_with(self, cols, target):
+        """Pearson correlation of each attribute with the target (rows without a target are skipped)."""
+        return self._attributes(cols).corrwith(pd.to_numeric(self.df[target], errors="coerce"))
+
+    def group_count(self, groups):
+        return self.df.groupby(groups).size().reset_index(name="Count")
+
+    def group_mean_median(self, group_cols, metric_cols):
+        count_df = self.df.groupby(group_cols).size().reset_index(name="Count")
+        mean_df = self.df.groupby(group_cols)[metric_cols].mean().add_prefix("Mean ").reset_index()
+        median_df = self.df.groupby(group_cols)[metric_cols].median().add_prefix("Median ").reset_index()
+        agg_df = pd.merge(count_df, mean_df, on=group_cols)
+        return pd.merge(agg_df, median_df, on=group_cols)
+
+    def mean_median(self, metric_cols):
+        return pd.DataFrame({
+            "Metric Name": metric_cols,
+            "Mean Value": self.df[metric_cols].mean().values,
+            "Median Value": self.df[metric_cols].median().values
+        })
+
+    def likert_counts(self, question_cols, category_col):
+        """Count raw responses per (category, question, response); missing responses are kept as NaN."""
+        subset = self.df[question_cols].copy()
+        subset[category_col] = self.df[category_col] if category_col in self.df.columns else "Unknown"
+        melted = subset.melt(id_vars=[category_col], var_name="Question", value_name="Response")
+        return melted.groupby([category_col, "Question", "Response"], dropna=False, sort=False).size().reset_index(name="Count")
+
+    def value_counts(self, col):
+        counts = self.df[col].value_counts().reset_index()
+        counts.columns = [col, "Count"]
+        return counts
+
+    def cross_products(self, target, columns):
+        """[1, X, y]ᵀ[1, X, y] over rows with a target value; missing attributes count as 0."""
+        data = self.df[columns + [target]].apply(pd.to_numeric, errors="coerce")
+        data = data[data[target].notna()].fillna(0)
+        data.insert(0, INTERCEPT, 1.0)
+        values = data.to_numpy(dtype=float)
+        return pd.DataFrame(values.T @ values, index=data.columns, columns=data.columns)
+
+
+class DuckDBBackend:
+    """Aggregations pushed down to DuckDB over Parquet files; only result frames reach pandas."""
+
+    name = "duckdb"
+
+    def __init__(self, parquet_path, grade_bands=(), zero_fill_cols=(), rename_map=None):
+        self.key = f"duckdb:{parquet_path}"
+        duckdb = startup.lazy_import("duckdb")
+        self.con = duckdb.connect()
+        raw = f"read_parquet({_literal(parquet_path)}, union_by_name=true)"
+        raw_schema = self.con.execute(f"DESCRIBE SELECT * FROM {raw}").df()
+        raw_types = dict(zip(raw_schema["column_name"], raw_schema["column_type"]))
+        renamed, renamed_cols = self._renaming_sql(raw, raw_types, rename_map or {})
+        cleaning = self._cleaning_sql(renamed, renamed_cols, grade_bands, zero_fill_cols)
+        self.con.execute(f"CREATE VIEW dataset AS {cleaning}")
+        self.source = "dataset"
+        self.schema = self.con.execute("DESCRIBE dataset").df()[["column_name", "column_type"]]
+
+    @staticmethod
+    def _renaming_sql(raw, raw_types, rename_map):
+        """app.py's rename_map as a subquery; returns (subquery, renamed columns).
+
+        Pooled files may spell the same question differently (with or without the
+        line break), so every raw column mapping to one short name is coalesced.
+        """
+        sources = {}
+        for col in raw_types:
+            sources.setdefault(rename_map.get(col, col), []).append(col)
+        if all(cols == [name] for name, cols in sources.items()):
+            return raw, list(sources)
+
+        def renamed(name, cols):
+            if cols == [name]:
+                return _quote(name)
+            # COALESCE needs one type; mixed spellings fall back to text (attributes are TRY_CAST later)
+            cast = "" if len({raw_types[c] for c in cols}) == 1 else "::VARCHAR"
+            return f"COALESCE({', '.join(_quote(c) + cast for c in cols)}) AS {_quote(name)}"
+
+        exprs = [renamed(name, cols) for name, cols in sources.items()]
+        return f"(SELECT {', '.join(exprs)} FROM {raw})", list(sources)
+
+    @staticmethod
+    def _cleaning_sql(raw, raw_cols, grade_bands, zero_fill_cols):
+        """app.py's cleaning steps as a SELECT over the raw Parquet columns."""
+        replace = []
+        extra = []
+        grade = find_grade_column(raw_cols)
+        if grade:
+            grade_value = f"TRY_CAST({_quote(grade)} AS DOUBLE)"
+            replace.append(f"{grade_value} AS {_quote(grade)}")
+            bands = " ".join(f"WHEN {grade_value} <= {upper} THEN {_literal(label)}" for upper, label in grade_bands)
+            category = f"CASE WHEN {grade_value} IS NULL THEN 'Unknown' {bands} ELSE 'Fail' END AS \"Grade Category\""
+            (replace if "Grade Category" in raw_cols else extra).append(category)
+        for col in zero_fill_cols:
+            if col in raw_cols:
+                replace.append(f"COALESCE(TRY_CAST({_quote(col)} AS DOUBLE), 0) AS {_quote(col)}")
+
+        row_id = "" if "Respondent ID" in raw_cols else "row_number() OVER () AS \"Respondent ID\", "
+        star = f"* REPLACE ({', '.join(replace)})" if replace else "*"
+        return f"SELECT {row_id}{star}{''.join(', ' + e for e in extra)} FROM {raw}"
+
+    def with_selection(self, df, target, attributes):
+        """Backend over the data after the sidebar coercion: numeric target, zero-filled attributes.
+
+        `df` is app.py's coerced frame; DuckDB ignores it and coerces in SQL over a
+        view of the same connection.
+        """
+        coerced = [f"TRY_CAST({_quote(target)} AS DOUBLE) AS {_quote(target)}"]
+        coerced += [f"{self._attribute(c)} AS {_quote(c)}" for c in attributes if c != target]
+        selected = copy.copy(self)
+        selected.source = f"(SELECT * REPLACE ({', '.join(coerced)}) FROM {self.source})"
+        selected.key = _selection_key(self.key, target, attributes)
+        return selected
+
+    def _query(self, sql):
+        # One cursor per query: the connection is shared by every session of the server
+        return self.con.cursor().execute(sql).df()
+
+    def columns(self):
+        return self.schema["column_name"].tolist()
+
+    def numeric_columns(self):
+        is_numeric = self.schema["column_type"].str.startswith(NUMERIC_SQL_TYPES)
+        return self.schema.loc[is_numeric, "column_name"].tolist()
+
+    def row_count(self):
+        return self.con.cursor().execute(f"SELECT COUNT(*) FROM {self.source}").fetchone()[0]
+
+    def preview(self, rows):
+        """First `rows` cleaned rows, for the row-level plots and the raw dataset view."""
+        return self._query(f"SELECT * FROM {self.source} LIMIT {int(rows)}")
+
+    @staticmethod
+    def _attribute(col):
+        return f"COALESCE(TRY_CAST({_quote(col)} AS DOUBLE), 0)"
+
+    def describe(self, cols):
+        """Descriptive statistics per attribute (rows = attributes, columns = SUMMARY_COLUMNS).
+
+        One scan: the attributes are unpivoted into per-value counts, and every statistic
+        is taken from those counts. Survey answers take few distinct values, so after the
+        scan only a small table is left.
+        """
+        values = ", ".join(f"{self._attribute(c)} AS {_quote(c)}" for c in cols)
+        stats = self._query(f"""
+            WITH counts AS (
+                SELECT "Attribute", v, COUNT(*) AS c
+                FROM (UNPIVOT (SELECT {values} FROM {self.source}) ON COLUMNS(*) INTO NAME "Attribute" VALUE v)
+                GROUP BY ALL
+            ), ranked AS (
+                SELECT *,
+                    SUM(c) OVER (PARTITION BY "Attribute") AS n,
+                    SUM(c * v) OVER (PARTITION BY "Attribute") / n AS mean,
+                    SUM(c) OVER (PARTITION BY "Attribute" ORDER BY v ROWS UNBOUNDED PRECEDING) AS up_to
+                FROM counts
+            )
+            SELECT "Attribute", ANY_VALUE(n) AS n, ANY_VALUE(mean) AS "Mean",
+                SUM(c * (v - mean) ^ 2) AS m2, SUM(c * (v - mean) ^ 3) AS m3, SUM(c * (v - mean) ^ 4) AS m4,
+                MIN(v) AS "Min", MAX(v) AS "Max",
+                -- Smallest of the most frequent values, like DataFrame.mode().iloc[0]
+                arg_max(v, [c, -v]) AS "Mode",
+                -- Middle value(s) in sorted order, averaged when n is even
+                (MIN(v) FILTER (WHERE up_to >= (n + 1) // 2) + MIN(v) FILTER (WHERE up_to >= n // 2 + 1)) / 2 AS "Median"
+            FROM ranked GROUP BY ALL
+        """).set_index("Attribute").reindex(cols)
+
+        # Sample variance and pandas' bias-corrected skewness/kurtosis from the central sums
+        # (rounding noise below 1e-14 is zeroed, as pandas does)
+        n = stats["n"].astype(float)
+        m2, m3, m4 = (stats[k].astype(float).mask(stats[k].abs() < 1e-14, 0) for k in ("m2", "m3", "m4"))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stats["Variance"] = m2 / (n - 1)
+            stats["Std Dev"] = np.sqrt(stats["Variance"])
+            skew = (n * (n - 1) ** 0.5 / (n - 2)) * (m3 / m2 ** 1.5)
+            kurt = (n * (n + 1) * (n - 1) * m4) / ((n - 2) * (n - 3) * m2 ** 2) - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+        # pandas reports 0 for a constant column and NaN below 3 (skew) or 4 (kurtosis) rows
+        stats["Skewness"] = skew.where(m2 != 0, 0).where(n >= 3)
+        stats["Kurtosis"] = kurt.where(m2 != 0, 0).where(n >= 4)
+        stats.index.name = None
+        return stats[SUMMARY_COLUMNS].astype(float)
+
+    def corr_with(self, cols, target):
+        """Pearson correlation of each attribute with the target (rows without a target are skipped)."""
+        corrs = ", ".join(f"CORR({self._attribute(c)}, TRY_CAST({_quote(target)} AS DOUBLE))" for c in cols)
+        row = self.con.cursor().execute(f"SELECT {corrs} FROM {self.source}").fetchone()
+        return pd.Series([np.nan if v is None else v for v in row], index=cols, dtype=float)
+
+    def _not_null(self, cols):
+        return " AND ".join(f"{_quote(c)} IS NOT NULL" for c in cols)
+
+    def group_count(self, groups):
+        keys = ", ".join(_quote(c) for c in groups)
+        return self._query(
+            f"SELECT {keys}, COUNT(*) AS \"Count\" FROM {self.source} "
+            f"WHERE {self._not_null(groups)} GROUP BY {keys} ORDER BY {keys}"
+        )
+
+    def group_mean_median(self, group_cols, metric_cols):
+        keys = ", ".join(_quote(c) for c in group_cols)
+        means = ", ".join(f"AVG({_quote(c)}) AS {_quote('Mean ' + c)}" for c in metric_cols)
+        medians = ", ".join(f"MEDIAN({_quote(c)}) AS {_quote('Median ' + c)}" for c in metric_cols)
+        return self._query(
+            f"SELECT {keys}, COUNT(*) AS \"Count\", {means}, {medians} FROM {self.source} "
+            f"WHERE {self._not_null(group_cols)} GROUP BY {keys} ORDER BY {keys}"
+        )
+
+    def mean_median(self, metric_cols):
+        means = ", ".join(f"AVG({_quote(c)})" for c in metric_cols)
+        medians = ", ".join(f"MEDIAN({_quote(c)})" for c in metric_cols)
+        row = self.con.cursor().execute(f"SELECT {means}, {medians} FROM {self.source}").fetchone()
+        return pd.DataFrame({
+            "Metric Name": metric_cols,
+            "Mean Value": list(row[:len(metric_cols)]),
+            "Median Value": list(row[len(metric_cols):])
+        })
+
+    def likert_counts(self, question_cols, category_col):
+        """Count raw responses per (category, question, response); missing responses are kept as NaN."""
+        category = _quote(category_col) if category_col in self.columns() else "'Unknown'"
+        branches = " UNION ALL ".join(
+            f"SELECT {category} AS {_quote(category_col)}, {_literal(c)} AS \"Question\", "
+            f"CAST({_quote(c)} AS VARCHAR) AS \"Response\" FROM {self.source}"
+            for c in question_cols
+        )
+        counts = self._query(
+            f"SELECT {_quote(category_col)}, \"Question\", \"Response\", COUNT(*) AS \"Count\" "
+            f"FROM ({branches}) GROUP BY ALL"
+        )
+        counts["Response"] = _restore_numeric(counts["Response"])
+        return counts
+
+    def value_counts(self, col):
+        return self._query(
+            f"SELECT {_quote(col)}, COUNT(*) AS \"Count\" FROM {self.source} "
+            f"WHERE {_quote(col)} IS NOT NULL GROUP BY {_quote(col)} ORDER BY \"Count\" DESC"
+        )
+
+    def cross_products(self, target, columns):
+        """[1, X, y]ᵀ[1, X, y] over rows with a target value; missing attributes count as 0."""
+        names = [INTERCEPT] + columns + [target]
+        exprs = ["CAST(1 AS DOUBLE)"] + [f"COALESCE(TRY_CAST({_quote(c)} AS DOUBLE), 0)" for c in columns + [target]]
+        pairs = [(i, j) for i in range(len(names)) for j in range(i, len(names))]
+        sums = ", ".join(f"SUM({exprs[i]} * {exprs[j]})" for i, j in pairs)
+        row = self.con.cursor().execute(
+            f"SELECT {sums} FROM {self.source} WHERE TRY_CAST({_quote(target)} AS DOUBLE) IS NOT NULL"
+        ).fetchone()
+        gram = np.zeros((len(names), len(names)))
+        for (i, j), value in zip(pairs, row):
+            gram[i, j] = gram[j, i] = float(value or 0.0)
+        return pd.DataFrame(gram, index=names, columns=names)
+
+
+def selected_backend():
+    return os.environ.get("DASHBOARD_QUERY_BACKEND", "pandas").lower()
+
+
+def get_backend(df, grade_bands=(), zero_fill_cols=(), rename_map=None):
+    """Pick the query backend from DASHBOARD_QUERY_BACKEND (defaults to pandas).
+
+    The DuckDB backend ignores `df` and applies the cleaning rules itself; one instance
+    is shared by every session of the server.
+    """
+    if selected_backend() == "duckdb":
+        path = os.environ.get("DASHBOARD_PARQUET", "dataset.parquet")
+        if path not in _duckdb_backends:
+            _duckdb_backends[path] = DuckDBBackend(path, grade_bands, zero_fill_cols, rename_map)
+        return _duckdb_backends[path]
+    return PandasBackend(df)
+
+
+@st.cache_data
+def cached_query(_backend, backend_key, dataset_key, method, args):
+    """Cached backend call, keyed on the backend, the dataset and the call's arguments.
+
+    Shared by app.py and startup's prewarm, so results computed before the server
+    starts are served to the first session.
+    """
+    return getattr(_backend, method)(*args)
@@ -0,0 +1,313 @@
+"""
+Concurrent-session load test for the dashboard.
+
+Starts app.py under a real `streamlit run` server on a synthetic dataset (fully offline)
+and drives N simulated analysts against it at the same time over local websockets,
+speaking the same protobuf protocol as the browser. Widget trees are parsed with
+Streamlit's AppTest element tree, so interactions read like AppTest scripts. (AppTest
+itself cannot run sessions concurrently: it swaps a process-wide runtime per run.)
+Each analyst runs in its own process, so one client's message parsing never delays
+another's latency measurement.
+
+Each analyst picks 10-25 attributes, then keeps switching data modes and graph types
+and re-selecting attributes.
+
+    python loadtest.py --sessions 8 --steps 20
+    python loadtest.py --sessions 16 --rows 5000 --max-p95 2.5   # exit 1 on regression
+
+Reports p50/p95/p99 rerun latency, throughput (reruns/s) and server memory per session.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+import numpy as np
+import pandas as pd
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+DATA_MODES = [
+    "Raw Data (Individual)",
+    "Count (Frequency)",
+    "Likert Scale Distribution",
+    "Mean Value (Flexible)",
+    "Trend of Correlation Coefficient",
+    "Multiple Regression (OLS)"
+]
+GRAPH_TYPES = [
+    "Scatter Plot",
+    "Line Graph",
+    "Bar Graph (Vertical)",
+    "Bar Graph (Horizontal)",
+    "Grouped Bar Graph",
+    "Pie Chart",
+    "Histogram",
+    "Box Plot"
+]
+
+
+# --- SYNTHETIC DATA ---
+def make_synthetic_dataset(rows, seed=0):
+    """Survey-shaped data using the dashboard's short column names."""
+    rng = np.random.default_rng(seed)
+    data = {
+        "Current Year Average Grade:": rng.choice([1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0, 5.0], rows),
+        "Sex": rng.choice(["Male", "Female"], rows),
+        "Year Level": rng.choice(["1st Year", "2nd Year", "3rd Year", "4th Year"], rows)
+    }
+    for col in ["AI CHATBOT", "AI FOR PROGRAMMING", "WRITING ASSISTANT",
+                "Coding", "Academic Assignment", "Learning Support", "Research"]:
+        data[col] = rng.integers(0, 2, rows)
+    for section in ["GPI", "UAI", "ISE", "CAU", "EAI"]:
+        for i in range(1, 6):
+            data[f"{section} Question #{i}"] = rng.integers(1, 6, rows)
+    return pd.DataFrame(data)
+
+
+# --- SERVER ---
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workdir, port, boot_timeout=60):
+    """Launch app.py under `streamlit run` and wait for the health check."""
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", APP_PATH,
+         "--server.headless", "true",
+         "--server.port", str(port),
+         "--server.fileWatcherType", "none",
+         "--browser.gatherUsageStats", "false"],
+        cwd=workdir,  # app.py looks for dataset.csv in the working directory
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + boot_timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as resp:
+                if resp.status == 200:
+                    return server
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError(f"Streamlit server did not become healthy within {boot_timeout}s")
+
+
+def _rss_mb(pid, field="VmRSS"):
+    # Linux only; returns None elsewhere
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+# --- SESSION DRIVER ---
+def _widget(tree, kind, label):
+    return next(w for w in getattr(tree, kind) if w.label == label)
+
+
+class Session:
+    """One browser-like websocket session.
+
+    Like the browser, it sends the state of every widget on the page that the
+    analyst has touched; untouched widgets keep their server-side defaults.
+    """
+
+    def __init__(self, ws, timeout):
+        self.ws = ws
+        self.timeout = timeout
+        self.tree = None
+        self.widget_states = {}
+
+    def set(self, widget, value):
+        """Set a radio/selectbox (one option) or multiselect (list of options) the way the browser does."""
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        state = WidgetState(id=widget.id)
+        if isinstance(value, list):
+            state.string_array_value.data[:] = [str(v) for v in value]
+        else:
+            state.string_value = str(value)
+        self.widget_states[widget.id] = state
+
+    async def rerun(self, latencies):
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+        from streamlit.testing.v1.element_tree import Widget, parse_tree_from_messages
+
+        back_msg = BackMsg()
+        if self.tree is not None:
+            on_page = {node.id for node in self.tree if isinstance(node, Widget)}
+            back_msg.rerun_script.widget_states.widgets.extend(
+                state for widget_id, state in self.widget_states.items() if widget_id in on_page
+            )
+        else:
+            back_msg.rerun_script.SetInParent()
+        started = time.perf_counter()
+        await self.ws.send(back_msg.SerializeToString())
+
+        messages = []
+        while True:
+            msg = ForwardMsg()
+            msg.ParseFromString(await asyncio.wait_for(self.ws.recv(), self.timeout))
+            if msg.WhichOneof("type") != "script_finished":
+                messages.append(msg)
+            elif msg.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                # Stop the clock on arrival, before the widget tree is parsed
+                latencies.append(time.perf_counter() - started)
+                break
+
+        self.tree = parse_tree_from_messages(messages)
+        if self.tree.exception:
+            raise RuntimeError(self.tree.exception[0].value)
+        return self.tree
+
+
+def _connect(port):
+    import websockets
+
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    return websockets.connect(url, subprotocols=["streamlit"], max_size=None)
+
+
+async def warm_up(port, timeout, attribute_count=15):
+    """Select attributes and visit every data mode once, so imports and the shared
+    caches (statistics, aggregations, cross-products) are filled before measurement."""
+    async with _connect(port) as ws:
+        session = Session(ws, timeout)
+        tree = await session.rerun([])
+        attributes = _widget(tree.sidebar, "multiselect", "Select Attributes to Compare:")
+        session.set(attributes, attributes.options[:attribute_count])
+        tree = await session.rerun([])
+        for mode in DATA_MODES:
+            session.set(_widget(tree, "radio", "Data Representation Mode:"), mode)
+            tree = await session.rerun([])
+            if mode == "Mean Value (Flexible)":
+                metrics = _widget(tree, "multiselect", "Numerical Variables:")
+                session.set(metrics, metrics.options[:3])
+                tree = await session.rerun([])
+
+
+async def run_session(port, session_id, steps, timeout, latencies):
+    """Drive one analyst through a scripted sequence; returns error messages."""
+    rng = random.Random(session_id)
+    errors = []
+    async with _connect(port) as ws:
+        session = Session(ws, timeout)
+        try:
+            await session.rerun(latencies)
+        except Exception as e:
+            return [str(e) or type(e).__name__]
+
+        for step in range(steps):
+            tree = session.tree
+            try:
+                if step % 5 == 0:
+                    attributes = _widget(tree.sidebar, "multiselect", "Select Attributes to Compare:")
+                    session.set(attributes, rng.sample(attributes.options, rng.randint(10, 25)))
+                elif step % 2 == 0:
+                    mode = rng.choice(DATA_MODES)
+                    session.set(_widget(tree, "radio", "Data Representation Mode:"), mode)
+                else:
+                    session.set(_widget(tree, "selectbox", "Select Graph Type:"), rng.choice(GRAPH_TYPES))
+                tree = await session.rerun(latencies)
+
+                if step % 5 and step % 2 == 0 and mode == "Mean Value (Flexible)":
+                    metrics = _widget(tree, "multiselect", "Numerical Variables:")
+                    session.set(metrics, rng.sample(metrics.options, 3))
+                    await session.rerun(latencies)
+            except Exception as e:
+                errors.append(str(e) or type(e).__name__)
+    return errors
+
+
+# --- REPORT ---
+def _session_process(port, session_id, steps, timeout):
+    latencies = []
+    errors = asyncio.run(run_session(port, session_id, steps, timeout, latencies))
+    return latencies, errors
+
+
+def _run_sessions(port, sessions, steps, timeout):
+    """Run each analyst in its own process; returns (latencies, error messages)."""
+    with multiprocessing.Pool(sessions) as pool:
+        results = pool.starmap(_session_process, [(port, session_id, steps, timeout) for session_id in range(sessions)])
+    latencies = [latency for session_latencies, _ in results for latency in session_latencies]
+    errors = [message for _, session_errors in results for message in session_errors]
+    return latencies, errors
+
+
+def run_load_test(sessions, steps, rows, timeout=60):
+    """Run `sessions` concurrent analysts; returns (summary dict, error messages)."""
+    workdir = tempfile.mkdtemp(prefix="dashboard-loadtest-")
+    make_synthetic_dataset(rows).to_csv(os.path.join(workdir, "dataset.csv"), index=False)
+    port = _free_port()
+    server = start_server(workdir, port)
+    try:
+        # Warm the shared caches first so the numbers describe steady-state reruns
+        asyncio.run(warm_up(port, timeout))
+        baseline_mb = _rss_mb(server.pid)
+
+        started = time.perf_counter()
+        latencies, errors = _run_sessions(port, sessions, steps, timeout)
+        elapsed = time.perf_counter() - started
+        peak_mb = _rss_mb(server.pid, "VmHWM")
+    finally:
+        server.terminate()
+        server.wait()
+
+    series = pd.Series(latencies, dtype=float)
+    per_session_mb = None
+    if baseline_mb is not None and peak_mb is not None:
+        per_session_mb = max(peak_mb - baseline_mb, 0.0) / sessions
+    return {
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "errors": len(errors),
+        "p50_s": series.quantile(0.50),
+        "p95_s": series.quantile(0.95),
+        "p99_s": series.quantile(0.99),
+        "throughput_rps": len(latencies) / elapsed if elapsed else 0.0,
+        "server_mb_per_session": per_session_mb
+    }, errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for app.py")
+    parser.add_argument("--sessions", type=int, default=8, help="Concurrent analysts")
+    parser.add_argument("--steps", type=int, default=20, help="Interactions per analyst")
+    parser.add_argument("--rows", type=int, default=2000, help="Rows in the synthetic dataset")
+    parser.add_argument("--timeout", type=float, default=60, help="Seconds allowed per rerun")
+    parser.add_argument("--max-p95", type=float, default=None, help="Fail if p95 latency (s) exceeds this")
+    args = parser.parse_args(argv)
+
+    summary, errors = run_load_test(args.sessions, args.steps, args.rows, args.timeout)
+    for key, value in summary.items():
+        print(f"{key:>20}: {value:.3f}" if isinstance(value, float) else f"{key:>20}: {value}")
+    for message in sorted(set(errors)):
+        print(f"error: {message}")
+
+    if errors:
+        return 1
+    if args.max_p95 is not None and summary["p95_s"] > args.max_p95:
+        print(f"p95 latency {summary['p95_s']:.3f}s exceeds --max-p95 {args.max_p95}s")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+OLS regression solved from a cross-product matrix.
+
+The backend builds G = [1, X, y]ᵀ[1, X, y] once per dataset and target (see
+backends.cross_products()). Every statistic here (coefficients, standardized
+coefficients, R², VIF) is derived from G, so changing the attribute set only
+re-solves a small linear system instead of rescanning rows.
+"""
+import numpy as np
+import pandas as pd
+
+from backends import INTERCEPT
+
+
+def _aliased(corr, attributes):
+    """Attributes that add no rank to the ones before them in the correlation matrix."""
+    aliased, kept = [], []
+    for i, attribute in enumerate(attributes):
+        if np.linalg.matrix_rank(corr[np.ix_(kept + [i], kept + [i])]) > len(kept):
+            kept.append(i)
+        else:
+            aliased.append(attribute)
+    return aliased
+
+
+def fit_ols(gram, target, attributes):
+    """Fit target ~ attributes from the cross-product matrix.
+
+    Returns (coef_df, fit) where coef_df has one row per attribute with
+    'Coefficient', 'Std. Coefficient' and 'VIF', and fit holds 'R²',
+    'Adjusted R²', 'Intercept' and 'Observations'.
+    """
+    n = gram.at[INTERCEPT, INTERCEPT]
+    p = len(attributes)
+    if n <= p + 1:
+        raise ValueError(f"Need more than {p + 1} rows with a target value to fit {p} predictors (have {int(n)}).")
+
+    cols = [INTERCEPT] + attributes
+    xtx = gram.loc[cols, cols].to_numpy()
+    xty = gram.loc[cols, target].to_numpy()
+    yty = gram.at[target, target]
+
+    # Means and sample standard deviations straight from the sums
+    sums = gram.loc[INTERCEPT, attributes + [target]].to_numpy()
+    means = sums / n
+    squares = np.diag(gram.loc[attributes + [target], attributes + [target]].to_numpy())
+    stds = np.sqrt(np.maximum(squares - n * means ** 2, 0) / (n - 1))
+    x_std, y_std = stds[:-1], stds[-1]
+
+    constant = [a for a, sd in zip(attributes, x_std) if sd == 0]
+    if constant:
+        raise ValueError(f"Predictors with no variance: {', '.join(constant)}")
+    if y_std == 0:
+        raise ValueError(f"{target} has no variance.")
+
+    # Predictor correlation matrix: singular exactly when predictors are collinear
+    cov = (xtx[1:, 1:] - n * np.outer(means[:-1], means[:-1])) / (n - 1)
+    corr = cov / np.outer(x_std, x_std)
+    aliased = _aliased(corr, attributes)
+    if aliased:
+        raise ValueError(f"Predictors that are linear combinations of the others: {', '.join(aliased)}")
+
+    beta = np.linalg.solve(xtx, xty)
+    sse = yty - 2 * beta @ xty + beta @ xtx @ beta
+    tss = yty - n * means[-1] ** 2
+    r2 = 1 - sse / tss
+    adj_r2 = 1 - (1 - r2) * (n - 1) / (n - p - 1)
+
+    # VIF_j = j-th diagonal of the inverse predictor correlation matrix
+    vif = np.diag(np.linalg.inv(corr))
+
+    coef_df = pd.DataFrame({
+        "Attribute": attributes,
+        "Coefficient": beta[1:],
+        "Std. Coefficient": beta[1:] * x_std / y_std,
+        "VIF": vif
+    })
+    fit = {"R²": r2, "Adjusted R²": adj_r2, "Intercept": beta[0], "Observations": int(n)}
+    return coef_df, fit
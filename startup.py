@@ -0,0 +1,185 @@
+"""
+Startup fast path for the dashboard.
+
+- lazy_import(): loads heavy modules (plotly, openpyxl, duckdb, ...) on first use
+  and records how long each import took.
+- read_dataset(): reads dataset.csv / dataset.xlsx through a Parquet snapshot in .cache/
+  so only the very first boot pays for openpyxl and the Excel parser. Parquet (unlike a
+  pickle) runs no code when read and doesn't depend on the pandas version that wrote it,
+  so pods can share the snapshot over a volume.
+- load_dataset_file(): the cached loader app.py uses; one read per server process.
+- prewarm(): boot-time hook. Run the server through this module so the heavy imports
+  and the selected backend's data (the dataset cache, or the DuckDB backend and its
+  preview) are ready in the server process before it starts listening (and so before
+  the health check reports ready):
+
+      python startup.py [streamlit run options, e.g. --server.port 8501]
+
+- profile_report(): import and read times, process start → server ready, and the
+  duration of the first script run. Launched through this module, the eager numpy,
+  pandas and streamlit imports are timed too; for a per-module breakdown of those, run
+  `python -X importtime startup.py 2> importtime.log`.
+"""
+import importlib
+import os
+import sys
+import tempfile
+import time
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+CACHE_DIR = ".cache"
+DATASET_FILENAMES = ["dataset.csv", "dataset.xlsx"]
+PREWARM_MODULES = ["plotly.express"]
+
+_step_times = {}
+_first_run = []
+
+
+def _process_start():
+    """Wall-clock start time of this process (Linux /proc), else the time this module loaded."""
+    try:
+        with open("/proc/self/stat") as f:
+            # Field 22 (starttime, in clock ticks since boot) follows the ")" closing the command name
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/stat") as f:
+            boot_time = next(int(line.split()[1]) for line in f if line.startswith("btime"))
+        return boot_time + start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, StopIteration):
+        return time.time()
+
+
+PROCESS_START = _process_start()
+
+
+# --- LAZY IMPORTS ---
+def lazy_import(name):
+    """Import a module on first use and record the time it took."""
+    if name in sys.modules:
+        return sys.modules[name]
+    started = time.perf_counter()
+    module = importlib.import_module(name)
+    _step_times[f"import {name}"] = time.perf_counter() - started
+    return module
+
+
+# Timed only when nothing imported them first (i.e. `python startup.py`); numpy on its
+# own so that pandas' time doesn't include it
+lazy_import("numpy")
+pd = lazy_import("pandas")
+st = lazy_import("streamlit")
+
+
+# --- DATASET SNAPSHOT ---
+def _snapshot_path(filename):
+    return os.path.join(CACHE_DIR, os.path.basename(filename) + ".parquet")
+
+
+def _write_snapshot(df, snapshot):
+    # Write to a temp file and swap it in, so pods sharing a volume never read a partial file
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        os.close(fd)
+        try:
+            df.to_parquet(tmp_path)
+            os.replace(tmp_path, snapshot)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    except Exception:
+        pass  # Read-only filesystem, or columns Parquet can't store: keep working without the snapshot
+
+
+def read_dataset(filename):
+    """Read a dataset file, going through a Parquet snapshot when it is up to date."""
+    lazy_import("pyarrow")
+    snapshot = _snapshot_path(filename)
+    if os.path.exists(snapshot) and os.path.getmtime(snapshot) >= os.path.getmtime(filename):
+        try:
+            return pd.read_parquet(snapshot)
+        except Exception:
+            pass  # Corrupt or partial: rebuild from the source
+
+    if filename.endswith(".csv"):
+        df = pd.read_csv(filename)
+    else:
+        lazy_import("openpyxl")
+        df = pd.read_excel(filename)
+
+    _write_snapshot(df, snapshot)
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def load_dataset_file(filename):
+    """Cached read of one dataset file; the timing is recorded on a cache miss only."""
+    started = time.perf_counter()
+    df = read_dataset(filename)
+    _step_times[f"read {filename}"] = time.perf_counter() - started
+    return df
+
+
+# --- PREWARM ---
+def prewarm():
+    """Import heavy modules and fill the selected backend's caches ahead of the first session.
+
+    Returns what was loaded (a dataset filename or the DuckDB backend key), or None.
+    Failures are only reported here; app.py retries and shows the error on the page.
+    """
+    import backends  # imports this module, so deferred until it is loaded
+    import survey
+
+    for name in PREWARM_MODULES:
+        lazy_import(name)
+    if backends.selected_backend() == "duckdb":
+        try:
+            backend = backends.get_backend(None, survey.grade_bands, survey.tool_cols + survey.mode_cols,
+                                           survey.rename_map)
+            backends.cached_query(backend, backend.key, backend.key, "preview", (backends.PREVIEW_ROWS,))
+            return backend.key
+        except Exception as e:
+            print(f"prewarm: couldn't open the DuckDB backend: {e}", file=sys.stderr)
+            return None
+    for filename in DATASET_FILENAMES:
+        if os.path.exists(filename):
+            try:
+                load_dataset_file(filename)
+                return filename
+            except Exception as e:
+                print(f"prewarm: couldn't read {filename}: {e}", file=sys.stderr)
+    return None
+
+
+# --- PROFILE ---
+def mark_render(run_started):
+    """Record how long the first script run in this process took (from its perf_counter() start)."""
+    if not _first_run:
+        _first_run.append(time.perf_counter() - run_started)
+
+
+def profile_report():
+    """Return the startup profile as a DataFrame (seconds per step)."""
+    rows = [{"Step": step, "Seconds": secs} for step, secs in _step_times.items()]
+    if _first_run:
+        rows.append({"Step": "first script run", "Seconds": _first_run[0]})
+    return pd.DataFrame(rows, columns=["Step", "Seconds"])
+
+
+def serve(streamlit_args):
+    """Prewarm in this process, then start the Streamlit server on app.py."""
+    cli = lazy_import("streamlit.web.cli")
+
+    started = time.perf_counter()
+    prewarm()
+    _step_times["prewarm"] = time.perf_counter() - started
+    # Idle time before the first visitor is not part of startup, so stop the clock here
+    _step_times["process start → server ready"] = time.time() - PROCESS_START
+    return cli.main(["run", APP_PATH, *streamlit_args], prog_name="streamlit")
+
+
+if __name__ == "__main__":
+    # Go through the importable module so app.py's `import startup` sees the warm caches;
+    # the eager imports were timed while this file ran as __main__
+    import startup
+    startup._step_times.update(_step_times)
+    sys.exit(startup.serve(sys.argv[1:]))
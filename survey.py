@@ -0,0 +1,78 @@
+"""
+The survey's column names and cleaning rules.
+
+app.py applies them to the in-memory frame; the DuckDB backend applies the same rules in
+its cleaning view, and startup's prewarm opens that backend before the first session.
+"""
+
+# --- GRADE BANDS ---
+# Upper bound (inclusive) of each band; anything above the last is "Fail"
+grade_bands = [(1.25, "Excellent"), (1.75, "Very Good"), (2.25, "Good"), (2.75, "Average"), (3.00, "Satistfactory")]
+
+# --- COLUMNS CLEANED TO 0/1 ---
+tool_cols = ['AI CHATBOT', 'AI FOR PROGRAMMING', 'WRITING ASSISTANT']
+mode_cols = ['Coding', 'Academic Assignment', 'Learning Support', 'Research']
+
+# --- SHORT NAMES FOR THE QUESTION HEADERS (ALL SECTIONS) ---
+# Each question appears twice: the export wraps long headers with "\n", and some exports don't
+rename_map = {
+    # --- GPI SECTION ---
+    "I believe AI has great potential to improve the\nquality of higher education for students.": "GPI Question #1",
+    "I believe AI has great potential to improve the quality of higher education for students.": "GPI Question #1",
+    "I think AI can positively transform the way students\nlearn and study.": "GPI Question #2",
+    "I think AI can positively transform the way students learn and study.": "GPI Question #2",
+    "AI can personalize my learning experiences\naccording to my needs.": "GPI Question #3",
+    "AI can personalize my learning experiences according to my needs.": "GPI Question #3",
+    "I am aware of AI applications being implemented\nin my educational institution.": "GPI Question #4",
+    "I am aware of AI applications being implemented in my educational institution.": "GPI Question #4",
+    "I have experienced benefits in my learning due to\nthe use of AI tools.": "GPI Question #5",
+    "I have experienced benefits in my learning due to the use of AI tools.": "GPI Question #5",
+
+    # --- UAI SECTION ---
+    "I use AI systems (e.g., learning platforms, chatbots) to support\nmy studies.": "UAI Question #1",
+    "I use AI systems (e.g., learning platforms, chatbots) to support my studies.": "UAI Question #1",
+    "I have used online learning platforms that apply AI to assess\nmy progress and adapt content.": "UAI Question #2",
+    "I have used online learning platforms that apply AI to assess my progress and adapt content.": "UAI Question #2",
+    "I interact with AI chatbots or virtual assistants to get academic\nhelp.": "UAI Question #3",
+    "I interact with AI chatbots or virtual assistants to get academic help.": "UAI Question #3",
+    "I use AI tools in research, data analysis, or coding tasks for my\ncourses.": "UAI Question #4",
+    "I use AI tools in research, data analysis, or coding tasks for my courses.": "UAI Question #4",
+    "In my experience, AI has had a positive impact on my learning\nand academic performance.": "UAI Question #5",
+    "In my experience, AI has had a positive impact on my learning and academic performance.": "UAI Question #5",
+
+    # --- ISE SECTION ---
+    "AI helps personalize learning content according to my needs\nand preferences.": "ISE Question #1",
+    "AI helps personalize learning content according to my needs and preferences.": "ISE Question #1",
+    "AI makes learning resources more accessible for me and my\npeers.": "ISE Question #2",
+    "AI makes learning resources more accessible for me and my peers.": "ISE Question #2",
+    "AI improves my ability to keep up with online or hybrid\nclasses.": "ISE Question #3",
+    "AI improves my ability to keep up with online or hybrid classes.": "ISE Question #3",
+    "AI influences how academic tasks and assignments are\nmanaged in my courses.": "ISE Question #4",
+    "AI influences how academic tasks and assignments are managed in my courses.": "ISE Question #4",
+    "AI enhances interaction and communication with my\nclassmates and instructors.": "ISE Question #5",
+    "AI enhances interaction and communication with my classmates and instructors.": "ISE Question #5",
+
+    # --- CAU SECTION ---
+    "I am concerned about the privacy of my personal data when AI\nsystems are used.": "CAU Question #1",
+    "I am concerned about the privacy of my personal data when AI systems are used.": "CAU Question #1",
+    "I am concerned that AI could create inequality in access to\neducational resources.": "CAU Question #2",
+    "I am concerned that AI could create inequality in access to educational resources.": "CAU Question #2",
+    "I worry that AI could replace some teaching or learning roles in the\nfuture.": "CAU Question #3",
+    "I worry that AI could replace some teaching or learning roles in the future.": "CAU Question #3",
+    "I am concerned about ethical issues in the use of AI algorithms in\neducation.": "CAU Question #4",
+    "I am concerned about ethical issues in the use of AI algorithms in education.": "CAU Question #4",
+    "I feel well-informed about institutional policies and practices\nregarding AI usage.": "CAU Question #5",
+    "I feel well-informed about institutional policies and practices regarding AI usage.": "CAU Question #5",
+
+    # --- EAI SECTION ---
+    "I believe AI will play a more significant role in higher\neducation in the future.": "EAI Question #1",
+    "I believe AI will play a more significant role in higher education in the future.": "EAI Question #1",
+    "I hope that AI will enhance the quality of learning in the\ncoming years.": "EAI Question #2",
+    "I hope that AI will enhance the quality of learning in the coming years.": "EAI Question #2",
+    "I expect AI to make higher education more accessible for\nstudents.": "EAI Question #3",
+    "I expect AI to make higher education more accessible for students.": "EAI Question #3",
+    "I believe AI will be essential in online learning and education\nin the future.": "EAI Question #4",
+    "I believe AI will be essential in online learning and education in the future.": "EAI Question #4",
+    "I think specific areas of my courses or field of study will\nbenefit from AI development.": "EAI Question #5",
+    "I think specific areas of my courses or field of study will benefit from AI development.": "EAI Question #5"
+}
@@ -0,0 +1,157 @@
+"""Parity between the pandas and DuckDB query backends."""
+import numpy as np
+import pandas as pd
+import pytest
+
+import backends
+import survey
+
+pytest.importorskip("duckdb")
+pytest.importorskip("pyarrow")
+
+GRADE_BANDS = [(1.25, "Excellent"), (1.75, "Very Good"), (2.25, "Good"), (2.75, "Average"), (3.00, "Satistfactory")]
+ZERO_FILL_COLS = ["AI CHATBOT", "Coding"]
+
+
+def categorize(grade):
+    if pd.isna(grade):
+        return "Unknown"
+    for upper, label in GRADE_BANDS:
+        if grade <= upper:
+            return label
+    return "Fail"
+
+
+def raw_frame(rows=300, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        backends.GRADE_COLUMN: rng.choice([1.0, 1.5, 2.0, 2.5, 3.0, 5.0], rows),
+        "Sex": rng.choice(["Male", "Female"], rows),
+        "AI CHATBOT": rng.choice([0.0, 1.0, np.nan], rows),
+        "Coding": rng.integers(0, 2, rows),
+        "GPI Question #1": rng.integers(1, 6, rows).astype(float),
+        "GPI Question #2": rng.integers(1, 6, rows),
+        "Hours": rng.normal(5, 2, rows)
+    })
+    df.loc[::17, backends.GRADE_COLUMN] = np.nan
+    df.loc[::11, "GPI Question #1"] = np.nan
+    return df
+
+
+def clean_like_app(df):
+    """The cleaning app.py applies to the in-memory frame."""
+    df = df.copy()
+    df[backends.GRADE_COLUMN] = pd.to_numeric(df[backends.GRADE_COLUMN], errors="coerce")
+    df["Grade Category"] = df[backends.GRADE_COLUMN].apply(categorize)
+    for col in ZERO_FILL_COLS:
+        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
+    df.insert(0, "Respondent ID", range(1, len(df) + 1))
+    return df
+
+
+@pytest.fixture(scope="module")
+def pair(tmp_path_factory):
+    raw = raw_frame()
+    path = tmp_path_factory.mktemp("parquet") / "survey.parquet"
+    raw.to_parquet(path, index=False)
+    return (backends.PandasBackend(clean_like_app(raw)),
+            backends.DuckDBBackend(str(path), GRADE_BANDS, ZERO_FILL_COLS))
+
+
+def assert_frames_match(left, right, sort_by=None):
+    if sort_by:
+        left = left.sort_values(sort_by).reset_index(drop=True)
+        right = right.sort_values(sort_by).reset_index(drop=True)
+    pd.testing.assert_frame_equal(left, right, check_dtype=False, check_index_type=False, atol=1e-9)
+
+
+def test_schema(pair):
+    pandas_backend, duckdb_backend = pair
+    assert duckdb_backend.columns() == pandas_backend.columns()
+    assert duckdb_backend.numeric_columns() == pandas_backend.numeric_columns()
+    assert duckdb_backend.row_count() == pandas_backend.row_count()
+
+
+def test_preview_is_cleaned(pair):
+    pandas_backend, duckdb_backend = pair
+    preview = duckdb_backend.preview(50)
+    assert len(preview) == 50
+    assert preview.columns.tolist() == pandas_backend.columns()
+    assert preview["AI CHATBOT"].notna().all()
+
+
+def test_describe(pair):
+    cols = ["GPI Question #1", "GPI Question #2", "Hours", "Sex"]
+    assert_frames_match(*(b.describe(cols) for b in pair))
+
+
+def test_corr_with(pair):
+    cols = ["GPI Question #1", "Hours", "AI CHATBOT"]
+    left, right = (b.corr_with(cols, backends.GRADE_COLUMN) for b in pair)
+    pd.testing.assert_series_equal(left, right, check_dtype=False, atol=1e-9)
+
+
+def test_group_count(pair):
+    groups = ["Grade Category", "Sex"]
+    assert_frames_match(*(b.group_count(groups) for b in pair))
+
+
+def test_group_mean_median(pair):
+    args = (["Sex"], ["Hours", "GPI Question #1"])
+    assert_frames_match(*(b.group_mean_median(*args) for b in pair))
+
+
+def test_mean_median(pair):
+    assert_frames_match(*(b.mean_median(["Hours", "GPI Question #1", "AI CHATBOT"]) for b in pair))
+
+
+def test_likert_counts(pair):
+    args = (["GPI Question #1", "GPI Question #2"], "Grade Category")
+    left, right = (b.likert_counts(*args) for b in pair)
+    keys = ["Grade Category", "Question", "Response"]
+    assert_frames_match(left, right, sort_by=keys)
+
+
+def test_value_counts(pair):
+    left, right = (b.value_counts("Grade Category") for b in pair)
+    assert_frames_match(left, right, sort_by=["Grade Category"])
+
+
+def test_cross_products(pair):
+    cols = ["GPI Question #1", "Hours", "AI CHATBOT"]
+    assert_frames_match(*(b.cross_products(backends.GRADE_COLUMN, cols) for b in pair))
+
+
+def test_original_question_headers_are_renamed(tmp_path):
+    wrapped, spaced = (h for h, short in survey.rename_map.items() if short == "GPI Question #1")
+    years = [raw_frame(40, seed=1).rename(columns={"GPI Question #1": wrapped}),
+             raw_frame(60, seed=2).rename(columns={"GPI Question #1": spaced})]
+    for year, frame in enumerate(years):
+        frame.to_parquet(tmp_path / f"year{year}.parquet", index=False)
+    duckdb_backend = backends.DuckDBBackend(str(tmp_path / "*.parquet"), GRADE_BANDS, ZERO_FILL_COLS, survey.rename_map)
+
+    pooled = pd.concat([frame.rename(columns=survey.rename_map) for frame in years], ignore_index=True)
+    pandas_backend = backends.PandasBackend(clean_like_app(pooled))
+    assert duckdb_backend.columns() == pandas_backend.columns()
+    preview = duckdb_backend.preview(100)
+    pd.testing.assert_series_equal(preview["GPI Question #1"], pooled["GPI Question #1"], check_dtype=False)
+
+
+def test_selection_coercion(pair):
+    pandas_backend, duckdb_backend = pair
+    target, attributes = backends.GRADE_COLUMN, ["Sex", "GPI Question #1"]
+    df = pandas_backend.df.copy()
+    df[target] = pd.to_numeric(df[target], errors="coerce")
+    for col in attributes:
+        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
+    selected = [b.with_selection(df, target, attributes) for b in pair]
+
+    assert selected[0].key != pandas_backend.key and selected[1].key != duckdb_backend.key
+    assert_frames_match(*(b.group_count(["Sex", "Grade Category"]) for b in selected))
+    assert_frames_match(*(b.mean_median(attributes) for b in selected))
+    args = (["GPI Question #1"], "Grade Category")
+    keys = ["Grade Category", "Question", "Response"]
+    assert_frames_match(*(b.likert_counts(*args) for b in selected), sort_by=keys)
+    # The dataset backends are unchanged
+    assert pandas_backend.df["Sex"].isin(["Male", "Female"]).all()
+    assert set(duckdb_backend.value_counts("Sex")["Sex"]) == {"Male", "Female"}
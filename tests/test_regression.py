@@ -0,0 +1,38 @@
+"""OLS from cross-products against a direct least-squares fit."""
+import numpy as np
+import pandas as pd
+import pytest
+
+import backends
+import regression
+
+
+def frame(rows=200, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({"a": rng.normal(size=rows), "b": rng.normal(size=rows), "c": rng.integers(1, 6, rows)})
+    df["y"] = 1.5 + 2 * df["a"] - df["b"] + 0.3 * df["c"] + rng.normal(size=rows)
+    return df
+
+
+def test_matches_lstsq():
+    df = frame()
+    gram = backends.PandasBackend(df).cross_products("y", ["a", "b", "c"])
+    coef_df, fit = regression.fit_ols(gram, "y", ["a", "b", "c"])
+
+    x = np.column_stack([np.ones(len(df)), df[["a", "b", "c"]]])
+    beta = np.linalg.lstsq(x, df["y"], rcond=None)[0]
+    r2 = 1 - ((df["y"] - x @ beta) ** 2).sum() / ((df["y"] - df["y"].mean()) ** 2).sum()
+    assert fit["Intercept"] == pytest.approx(beta[0])
+    assert coef_df["Coefficient"].tolist() == pytest.approx(beta[1:].tolist())
+    assert fit["R²"] == pytest.approx(r2)
+    assert fit["Observations"] == len(df)
+
+
+def test_collinear_predictors_are_named():
+    df = frame()
+    df["a plus b"] = df["a"] + df["b"]
+    df["twice c"] = 2 * df["c"]
+    attributes = ["a", "b", "a plus b", "c", "twice c"]
+    gram = backends.PandasBackend(df).cross_products("y", attributes)
+    with pytest.raises(ValueError, match="linear combinations of the others: a plus b, twice c$"):
+        regression.fit_ols(gram, "y", attributes)
@@ -0,0 +1,81 @@
+"""Startup fast path: the dataset snapshot and prewarm fallbacks."""
+import os
+
+import pandas as pd
+import pytest
+
+import backends
+import startup
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # Dataset files and the snapshot cache are looked up relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("DASHBOARD_QUERY_BACKEND", raising=False)
+    startup.load_dataset_file.clear()
+    yield tmp_path
+    startup.load_dataset_file.clear()
+
+
+def survey_frame():
+    return pd.DataFrame({backends.GRADE_COLUMN: [1.25, 2.0, 3.0], "AI CHATBOT": [1, 0, 1]})
+
+
+def write_csv(path, df, mtime):
+    df.to_csv(path, index=False)
+    os.utime(path, (mtime, mtime))
+
+
+def test_snapshot_is_reused_until_source_changes(workdir):
+    pytest.importorskip("pyarrow")
+    source = workdir / "dataset.csv"
+    write_csv(source, survey_frame(), mtime=1_000_000)
+    pd.testing.assert_frame_equal(startup.read_dataset("dataset.csv"), survey_frame())
+    snapshot = startup._snapshot_path("dataset.csv")
+    assert os.path.exists(snapshot)
+
+    # Same content on disk but a stale snapshot with different data: the snapshot wins
+    stale = survey_frame().assign(**{"AI CHATBOT": [9, 9, 9]})
+    stale.to_parquet(snapshot)
+    pd.testing.assert_frame_equal(startup.read_dataset("dataset.csv"), stale)
+
+    # A newer source invalidates it
+    changed = survey_frame().iloc[:2]
+    write_csv(source, changed, mtime=os.path.getmtime(snapshot) + 10)
+    pd.testing.assert_frame_equal(startup.read_dataset("dataset.csv"), changed)
+    pd.testing.assert_frame_equal(pd.read_parquet(snapshot), changed)
+
+
+def test_corrupt_snapshot_is_rebuilt(workdir):
+    pytest.importorskip("pyarrow")
+    write_csv(workdir / "dataset.csv", survey_frame(), mtime=1_000_000)
+    snapshot = startup._snapshot_path("dataset.csv")
+    os.makedirs(os.path.dirname(snapshot))
+    with open(snapshot, "wb") as f:
+        f.write(b"PAR1 truncated")
+    pd.testing.assert_frame_equal(startup.read_dataset("dataset.csv"), survey_frame())
+    pd.testing.assert_frame_equal(pd.read_parquet(snapshot), survey_frame())
+
+
+def test_unstorable_columns_skip_the_snapshot(workdir):
+    mixed = pd.DataFrame({"Year Level": [1, "2nd Year", 3.5]}, dtype=object)
+    startup._write_snapshot(mixed, startup._snapshot_path("dataset.xlsx"))
+    assert os.listdir(workdir / startup.CACHE_DIR) == []
+
+
+def test_prewarm_skips_unreadable_file(workdir):
+    (workdir / "dataset.csv").write_text("")
+    survey_frame().to_excel(workdir / "dataset.xlsx", index=False)
+    assert startup.prewarm() == "dataset.xlsx"
+
+
+def test_prewarm_opens_selected_duckdb_backend(workdir, monkeypatch):
+    pytest.importorskip("duckdb")
+    pytest.importorskip("pyarrow")
+    survey_frame().to_parquet(workdir / "pooled.parquet", index=False)
+    monkeypatch.setenv("DASHBOARD_QUERY_BACKEND", "duckdb")
+    monkeypatch.setenv("DASHBOARD_PARQUET", str(workdir / "pooled.parquet"))
+    monkeypatch.setattr(backends, "_duckdb_backends", {})
+    assert startup.prewarm() == f"duckdb:{workdir / 'pooled.parquet'}"
+    assert str(workdir / "pooled.parquet") in backends._duckdb_backends